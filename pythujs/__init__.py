@@ -58,15 +58,131 @@ and WebSocket integration are essential without the overhead of large frameworks
 """
 
 import asyncio
-import os, signal, logging, inspect
+import json
+import os, signal, logging, inspect, sys
+from functools import lru_cache
 from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse, HTMLResponse, Response
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Any, Callable, Literal, Optional, Self, Type
 from uvicorn import Config, Server
 from pydantic import BaseModel
 
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _json_loads(data: str | bytes) -> Any:
+        return orjson.loads(data)
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+    _response_class = ORJSONResponse
+else:
+    def _json_loads(data: str | bytes) -> Any:
+        return json.loads(data)
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
+    _response_class = JSONResponse
+
+def _resolve_loop(loop: str) -> str:
+    """
+    Map the server `loop` option onto a uvicorn loop implementation.
+
+    "uring" opts into an io_uring-backed event loop (Linux kernel 5.11+
+    and the asyncio_uring package required); when that is unavailable it
+    falls back to the "auto" behaviour of uvloop where installed, plain
+    asyncio otherwise.
+    """
+    if loop == "uring" and sys.platform == "linux":
+        try:
+            import asyncio_uring
+            asyncio_uring.install()
+            return "asyncio"
+        except ImportError:
+            logging.getLogger("pythujs").warning(
+                "asyncio_uring not available, falling back to default loop")
+    if loop in ("auto", "uring"):
+        return "uvloop" if uvloop else "asyncio"
+    return loop
+
+# Upper bound of the per-client outbound queue; a client that cannot
+# drain this many pending messages is considered too slow to keep up.
+_WS_QUEUE_MAX = 1000
+
+try:
+    # Read the JS SDK once; it never changes at runtime, so /pythujs can
+    # serve the cached bytes instead of re-opening the file per request.
+    _PYTHUJS_JS: Optional[bytes] = open("pythujs.js", "rb").read()
+except OSError:
+    _PYTHUJS_JS = None
+
+@lru_cache(maxsize=256)
+def _build_dynamic_model(fields: tuple, base: tuple) -> Type[BaseModel]:
+    """
+    Build (and memoize) a pydantic model class for a fields spec.
+
+    Compiling a pydantic v2 model class is not cheap, so identical
+    field/base specs share one cached class instead of rebuilding the
+    core schema per call.
+    """
+    annotations = {}
+    defaults = {}
+    for key, value in fields:
+        if isinstance(value, tuple) and len(value) == 2:
+            annotations[key] = value[0]
+            defaults[key] = value[1]
+        else:
+            annotations[key] = value
+    return type(
+        "DynamicModel",
+        (BaseModel,),
+        {**defaults, "__annotations__": annotations, **dict(base)}
+    )
+
+class HandlerSpec:
+    """
+    Per-handler dispatch record: the validation model, the precompiled
+    injection plan and the handler coroutine. Slotted to keep entries
+    small and attribute access on the C fast path.
+    """
+    __slots__ = ("model", "injections", "func")
+
+    def __init__(self, model: Optional[Type[BaseModel]], injections: tuple, func: Callable):
+        self.model = model
+        self.injections = injections
+        self.func = func
+
+# Symbolic injection kinds, resolved once at registration so the
+# dispatchers compare small ints instead of annotation types per call.
+_INJECT_NONE = 0
+_INJECT_WS = 1
+_INJECT_REQ = 2
+_INJECT_KINDS = {WebSocket: _INJECT_WS, Request: _INJECT_REQ}
+
+def _injection_plan(annotations: dict[str, Any]) -> tuple:
+    """
+    Build the per-handler injection plan once at registration time.
+
+    Returns a tuple of (param_name, injection_kind) pairs for every
+    annotated parameter except `data` and `return`, so dispatchers can
+    build the keyword arguments for a call without re-walking the
+    signature or touching the annotation objects again.
+    """
+    return tuple(
+        (name, _INJECT_KINDS.get(annot, _INJECT_NONE))
+        for name, annot in annotations.items()
+        if name not in ("data", "return")
+    )
+
 class StartingServerError(Exception):
     """
     Raised when there is an error starting the Pythujs server.
@@ -85,84 +201,32 @@ class SenderError(Exception):
     """
     pass
 
-class PythujsServer:
+class _DispatchBase:
     """
-    Main server class for the Pythujs framework.
+    Shared dispatch core for `PythujsServer` and `Child`.
 
-    Handles REST and WebSocket routes, static file serving, CORS,
-    dynamic handler registration, and concurrent execution of child servers.
+    Everything on the request/message hot path — the WebSocket dispatcher,
+    the per-client writer loop, the REST dispatcher and handler
+    registration — lives here exactly once, so both server types share a
+    single set of hot functions. Subclasses own construction and the
+    server lifecycle and are expected to set the attributes below.
     """
 
-    def __init__(self: Self, *, 
-                request_base: Optional[dict] = {},
-                static_folder: Optional[str] = None,
-                init_base: bool = True,
-                host: str = "0.0.0.0",
-                port: int = 8000,
-                reload: bool = False,
-                log_config: Optional[dict] = None,
-                static_origin: str = "/static",
-                is_static_folder_html: bool = True,
-                show_errors: bool = False,
-                allow_origin: list = ["*"], 
-                allow_headers: list = ["*"], 
-                allowed_credentials: bool = True,
-                ws_endpoint: str = "ws"):
-        self.show_errors = show_errors
-        self._api = FastAPI()
-        self.init_base = init_base
-        self._run_config = Config(
-            app=self._api,
-            host=host,
-            port=port,
-            reload=reload,
-            log_config=log_config,
-        )
-        self.ws_endpoint = ws_endpoint
-
-        try:
-            self._api.add_middleware(
-                CORSMiddleware,
-                allow_origins=allow_origin,
-                allow_credentials=allowed_credentials,
-                allow_methods=["GET", "POST"],
-                allow_headers=allow_headers,
-            )
-        except Exception as e:
-            raise StartingServerError("Error while adding CORS middleware!") from e
-
-        if static_folder:
-            if not os.path.exists(static_folder):
-                raise StartingServerError(f"Static folder does not exist: {static_folder}")
-            if not static_origin.startswith("/"):
-                static_origin = "/" + static_origin
-            self._api.mount(static_origin, StaticFiles(directory=static_folder, html=is_static_folder_html), name="static")
-        self.logger = logging.getLogger("pythujs")
-        self.request_base = request_base
-        self.handlers: dict = {}
-        self.ws_handlers: dict[str, Callable] = {}
-        self.active_sockets: dict[str, WebSocket] = {}
-        self._api.websocket("/"+ws_endpoint)(self._ws_dispatcher)
-        self.children: list[Child] = []
-
-    async def run(self: Self):
-        tasks = []
-        for i in self.children:
-            await i._init_base()
-            task = asyncio.create_task(i.run())
-            tasks.append(task)
-        if self.init_base:
-            await self._init_base()
-        self._api.api_route("/{path:path}", methods=["GET", "POST"])(self._distpatcher)
-
-        self.server = Server(config=self._run_config)
-        self.logger.info("Starting Pythujs server...")
-        return await asyncio.gather(self.server.serve(), *tasks)
+    _api: FastAPI
+    logger: logging.Logger
+    handlers: dict
+    active_sockets: dict[WebSocket, asyncio.Queue]
+    request_base: dict
+    show_errors: bool
+    coalesce_ms: float
+    coalesce_max: int
+    ws_endpoint: str
 
     async def _ws_dispatcher(self, websocket: WebSocket):
         await websocket.accept()
-        uid = str(id(websocket))
-        self.active_sockets[uid] = websocket
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_WS_QUEUE_MAX)
+        writer = asyncio.create_task(self._writer_loop(websocket, queue))
+        self.active_sockets[websocket] = queue
         try:
             if hasattr(self, "_on_connect_handler"):
                 try:
@@ -172,50 +236,77 @@ class PythujsServer:
                     await websocket.close()
                     return
 
+            # Bind everything the loop touches to locals once; attribute
+            # lookups on self/websocket would otherwise repeat per message.
+            receive_text = websocket.receive_text
+            handlers_get = self.handlers.get
+            enqueue = queue.put
+            show_errors = self.show_errors
             while True:
-                payload = await websocket.receive_json()
+                payload = _json_loads(await receive_text())
                 method = payload.get("method")
                 data = payload.get("data", {})
-                handler = self.handlers.get(method)
-                if not handler:
-                    await websocket.send_json({"error": f"Handler not found: {method}"})
+                spec = handlers_get(method)
+                if not spec:
+                    await enqueue(_json_dumps({"error": f"Handler not found: {method}"}))
                     continue
-                model: Type[BaseModel] = handler["model"]
+                model, injections, func = spec.model, spec.injections, spec.func
                 try:
-                    model_data = self.validate(model, data) if model else None
-                    kwds = self.resolve_annotations(handler["sig"], {WebSocket: websocket})
-                    kwds.pop("data", None)
-                    result = await handler["func"](data=model_data, **kwds)
-                    await websocket.send_json(result)
+                    model_data = model.__pydantic_validator__.validate_python(data) if model else None
+                    kwds = {name: websocket if kind == _INJECT_WS else None for name, kind in injections}
+                    result = await func(data=model_data, **kwds)
+                    await enqueue(_json_dumps(result))
                 except Exception as e:
-                    await websocket.send_json({"error": str(e) if self.show_errors else "Internal server error"})
+                    await enqueue(_json_dumps({"error": str(e) if show_errors else "Internal server error"}))
         except WebSocketDisconnect:
-            self.active_sockets.pop(uid, None)
+            pass
         except Exception:
-            self.active_sockets.pop(uid, None)
             await websocket.close()
+        finally:
+            writer.cancel()
+            self.active_sockets.pop(websocket, None)
+
+    async def _writer_loop(self, websocket: WebSocket, queue: asyncio.Queue):
+        coalesce_s = self.coalesce_ms / 1000
+        while True:
+            payload = await queue.get()
+            if coalesce_s:
+                # Nagle-style batching: drain further pending messages for
+                # up to coalesce_ms and fuse them into one JSON array frame.
+                batch = [payload]
+                while len(batch) < self.coalesce_max:
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout=coalesce_s))
+                    except asyncio.TimeoutError:
+                        break
+                if len(batch) > 1:
+                    payload = "[" + ",".join(batch) + "]"
+            try:
+                await websocket.send_text(payload)
+            except Exception:
+                self.active_sockets.pop(websocket, None)
+                break
 
-    async def _distpatcher(self, path: str, request: Request):
-        handler = self.handlers.get(path, None)
-        if not handler:
-            raise HTTPException(status_code=404, detail=f"Handler not found for path: {path}")
-        model: Type[BaseModel] = handler["model"]
+    async def _distpatcher(self, spec: HandlerSpec, path: str, request: Request):
+        model, injections, func = spec.model, spec.injections, spec.func
         if model:
             try:
                 if request.method == "GET":
                     data = dict(request.query_params)
                 else:
-                    data = await request.json()
+                    data = _json_loads(await request.body())
             except Exception as e:
                 raise HTTPException(status_code=422, detail="Field validation error: "+str(e))
-        data = self.validate(model, data) if model else None
-        if isinstance(data, HTTPException):
-            return data
+            try:
+                data = model.__pydantic_validator__.validate_python(data)
+            except Exception as e:
+                raise HTTPException(status_code=422, detail="Field validation error: "+str(e) if self.show_errors else "Field validation error")
+        else:
+            data = None
         try:
-            self.logger.info(f"Handling request for path: {path} with data: {data}")
-            kwds = self.resolve_annotations(handler["sig"], {Request: request})
-            kwds.pop("data", None)
-            response = await handler["func"](data=data, **kwds)
+            self.logger.info("Handling request for path: %s with data: %s", path, data)
+            kwds = {name: request if kind == _INJECT_REQ else None for name, kind in injections}
+            response = await func(data=data, **kwds)
             return response
         except Exception as e:
             self.logger.error(f"Error while handling request for path: {path}\n{str(e)}")
@@ -229,7 +320,7 @@ class PythujsServer:
                 return {"status": "ok"}
             except Exception as e:
                 raise HTTPException(status_code=500, detail="Internal server error" + (": "+str(e) if self.show_errors else ""))
-            
+
         @self.handler("info")
         async def info_handler(data):
             try:
@@ -239,59 +330,43 @@ class PythujsServer:
                 }
             except Exception as e:
                 raise HTTPException(status_code=500, detail="Internal server error" + (": "+str(e) if self.show_errors else ""))
-        
-        @self._api.get("/pythujs", response_class=Response)
-        async def pythujs():
-            return Response(
-                content=open("pythujs.js", "r", encoding="utf-8").read(),
-                media_type="text/javascript"
-            )
 
-    async def ws_send(self, uuid: str, data: dict):
+    async def ws_send(self, target: WebSocket | str, data: dict):
         if data.get("update") is None:
             raise SenderError("Data must contain an 'update' field.")
         if data.get("data") is None:
             raise SenderError("Data must contain a 'data' field.")
-        ws = self.active_sockets.get(uuid)
-        if ws:
-            if isinstance(data, dict):
-                await ws.send_json(data)
-            else:
-                await ws.send_text(data)
+        if isinstance(target, WebSocket):
+            queue = self.active_sockets.get(target)
+        else:
+            queue = next((q for sock, q in self.active_sockets.items() if str(id(sock)) == target), None)
+        if queue is not None:
+            await queue.put(_json_dumps(data) if isinstance(data, dict) else data)
 
     async def ws_broadcast(self, data: dict):
         if data.get("update") is None:
             raise SenderError("Data must contain an 'update' field.")
         if data.get("data") is None:
             raise SenderError("Data must contain a 'data' field.")
-        for ws in list(self.active_sockets.values()):
+        payload = _json_dumps(data)
+        # The loop never awaits and never deletes entries (slow clients just
+        # drop the message), so iterating the live dict is safe and avoids
+        # snapshotting N sockets per broadcast.
+        for queue in self.active_sockets.values():
             try:
-                if isinstance(data, dict):
-                    await ws.send_json(data)
-                else:
-                    await ws.send_text(data)
-            except Exception:
-                self.active_sockets.pop(str(id(ws)), None)
-
-    def resolve_annotations(self, annot_dict: dict[str, Any], obj_dict: dict[type, Any]) -> dict[str, Any]:
-        result = {}
-        for name, annot_type in annot_dict.items():
-            if annot_type in obj_dict and obj_dict[annot_type] is not None:
-                result[name] = obj_dict[annot_type]
-            else:
-                result[name] = None
-        return result
-
-    def validate(self, model: Type[BaseModel], json: dict | list):
-        try:
-            return model.model_validate(json)
-        except Exception as e:
-            return HTTPException(status_code=422, detail="Field validation error: "+str(e) if self.show_errors else "Field validation error")
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                self.logger.warning("Dropping broadcast for slow WebSocket client")
 
     def new_handler(self: Self, method: str, func: Callable, /, model: Optional[Type[BaseModel]], sig: dict):
-        self.handlers[method] = {
-            "model": model, "sig": sig, "func": func
-        }
+        spec = HandlerSpec(model, _injection_plan(sig), func)
+        self.handlers[method] = spec
+        self._register_route(method, spec)
+
+    def _register_route(self: Self, method: str, spec: HandlerSpec):
+        async def endpoint(request: Request):
+            return await self._distpatcher(spec, method, request)
+        self._api.add_api_route("/" + method, endpoint, methods=["GET", "POST"])
 
     def handler(self: Self, method: str):
         def wrapper(func):
@@ -307,19 +382,13 @@ class PythujsServer:
         return wrapper
 
     def model(self, **fields):
-        annotations = {}
-        defaults = {}
-        for key, value in fields.items():
-            if isinstance(value, tuple) and len(value) == 2:
-                annotations[key] = value[0]
-                defaults[key] = value[1]
-            else:
-                annotations[key] = value
-        return type(
-            "DynamicModel",
-            (BaseModel,),
-            {**defaults, "__annotations__": annotations, **self.request_base}
-        )
+        key = tuple(sorted(fields.items()))
+        base = tuple(sorted(self.request_base.items()))
+        try:
+            return _build_dynamic_model(key, base)
+        except TypeError:
+            # Unhashable field spec (e.g. a mutable default) — build uncached.
+            return _build_dynamic_model.__wrapped__(key, base)
 
     def on_connect(self: Self, func: Callable):
         self._on_connect_handler = func
@@ -328,12 +397,103 @@ class PythujsServer:
     async def stop(self: Self):
         self.server.shutdown()
         os.kill(os.getpid(), signal.SIGINT)
-        self.logger.info(f"Pythujs server stopped.") 
+        self.logger.info(f"Pythujs server stopped.")
 
     def include_router(self, router: 'Router'):
-        self.handlers.update({
-            f"{router.name}/{k}": v for k, v in router.handlers.items()
-        })
+        for k, v in router.handlers.items():
+            method = f"{router.name}/{k}"
+            self.handlers[method] = v
+            self._register_route(method, v)
+
+class PythujsServer(_DispatchBase):
+    """
+    Main server class for the Pythujs framework.
+
+    Handles REST and WebSocket routes, static file serving, CORS,
+    dynamic handler registration, and concurrent execution of child servers.
+    """
+
+    def __init__(self: Self, *,
+                request_base: Optional[dict] = None,
+                static_folder: Optional[str] = None,
+                init_base: bool = True,
+                host: str = "0.0.0.0",
+                port: int = 8000,
+                reload: bool = False,
+                loop: Literal["auto", "uvloop", "uring"] = "auto",
+                log_config: Optional[dict] = None,
+                static_origin: str = "/static",
+                is_static_folder_html: bool = True,
+                show_errors: bool = False,
+                allow_origin: Optional[list] = None,
+                allow_headers: Optional[list] = None,
+                allowed_credentials: bool = True,
+                coalesce_ms: float = 0,
+                coalesce_max: int = 32,
+                ws_endpoint: str = "ws"):
+        self.show_errors = show_errors
+        self._api = FastAPI(default_response_class=_response_class)
+        self.init_base = init_base
+        self._run_config = Config(
+            app=self._api,
+            host=host,
+            port=port,
+            reload=reload,
+            log_config=log_config,
+            loop=_resolve_loop(loop),
+            http="httptools",
+            ws="websockets",
+        )
+        self.ws_endpoint = ws_endpoint
+        self.coalesce_ms = coalesce_ms
+        self.coalesce_max = coalesce_max
+
+        self._api.add_middleware(
+            CORSMiddleware,
+            allow_origins=allow_origin if allow_origin is not None else ["*"],
+            allow_credentials=allowed_credentials,
+            allow_methods=["GET", "POST"],
+            allow_headers=allow_headers if allow_headers is not None else ["*"],
+        )
+
+        if static_folder:
+            if not os.path.exists(static_folder):
+                raise StartingServerError(f"Static folder does not exist: {static_folder}")
+            if not static_origin.startswith("/"):
+                static_origin = "/" + static_origin
+            self._api.mount(static_origin, StaticFiles(directory=static_folder, html=is_static_folder_html), name="static")
+        self.logger = logging.getLogger("pythujs")
+        self.request_base = request_base if request_base is not None else {}
+        self.handlers: dict = {}
+        self.active_sockets: dict[WebSocket, asyncio.Queue] = {}
+        self._api.websocket("/"+ws_endpoint)(self._ws_dispatcher)
+        self.children: list[Child] = []
+
+    async def run(self: Self):
+        tasks = []
+        for i in self.children:
+            await i._init_base()
+            task = asyncio.create_task(i.run())
+            tasks.append(task)
+        if self.init_base:
+            await self._init_base()
+
+        self.server = Server(config=self._run_config)
+        self.logger.info("Starting Pythujs server...")
+        return await asyncio.gather(self.server.serve(), *tasks)
+
+    async def _init_base(self: Self):
+        await super()._init_base()
+
+        @self._api.get("/pythujs", response_class=Response)
+        async def pythujs():
+            content = _PYTHUJS_JS
+            if content is None:
+                content = open("pythujs.js", "rb").read()
+            return Response(
+                content=content,
+                media_type="text/javascript"
+            )
 
     def include_child(self, child: 'Child'):
         child._parent = self
@@ -358,106 +518,8 @@ class Router:
         self.route = f"{name}/"
 
     def new_handler(self: Self, method: str, func: Callable, /, model: Optional[Type[BaseModel]], sig: dict):
-        self.handlers[self.route+method] = {
-            "model": model, "sig": sig, "func": func
-        }
-
-    def handler(self: Self, method: str):
-        def wrapper(func):
-            sig = inspect.signature(func)
-            annot = sig.parameters["data"].annotation
-            if not issubclass(annot, BaseModel):
-                if not annot == inspect._empty:
-                    raise HandlerError(f"Handler function must have a pydantic BaseModel as data parameter annotation!")
-                else:
-                    annot = None
-            self.new_handler(method, func, model=annot, sig=func.__annotations__)
-            return func
-        return wrapper
-
-class Child:
-    async def _ws_dispatcher(self, websocket: WebSocket):
-        await websocket.accept()
-        uid = str(id(websocket))
-        self.active_sockets[uid] = websocket
-        try:
-            if hasattr(self, "_on_connect_handler"):
-                try:
-                    await self._on_connect_handler(websocket)
-                except Exception as e:
-                    self.logger.error(f"Error in on_connect: {e}")
-                    await websocket.close()
-                    return
-
-            while True:
-                payload = await websocket.receive_json()
-                method = payload.get("method")
-                data = payload.get("data", {})
-                handler = self.handlers.get(method)
-                if not handler:
-                    await websocket.send_json({"error": f"Handler not found: {method}"})
-                    continue
-                model: Type[BaseModel] = handler["model"]
-                try:
-                    model_data = self.validate(model, data) if model else None
-                    kwds = self.resolve_annotations(handler["sig"], {WebSocket: websocket})
-                    kwds.pop("data", None)
-                    result = await handler["func"](data=model_data, **kwds)
-                    await websocket.send_json(result)
-                except Exception as e:
-                    await websocket.send_json({"error": str(e) if self.show_errors else "Internal server error"})
-        except WebSocketDisconnect:
-            self.active_sockets.pop(uid, None)
-        except Exception:
-            self.active_sockets.pop(uid, None)
-            await websocket.close()
+        self.handlers[self.route+method] = HandlerSpec(model, _injection_plan(sig), func)
 
-    async def _distpatcher(self, path: str, request: Request):
-        handler = self.handlers.get(path, None)
-        if not handler:
-            raise HTTPException(status_code=404, detail=f"Handler not found for path: {path}")
-        model: Type[BaseModel] = handler["model"]
-        if model:
-            try:
-                if request.method == "GET":
-                    data = dict(request.query_params)
-                else:
-                    data = await request.json()
-            except Exception as e:
-                raise HTTPException(status_code=422, detail="Field validation error: "+str(e))
-        data = self.validate(model, data) if model else None
-        if isinstance(data, HTTPException):
-            return data
-        try:
-            self.logger.info(f"Handling request for path: {path} with data: {data}")
-            kwds = self.resolve_annotations(handler["sig"], {Request: request})
-            kwds.pop("data", None)
-            response = await handler["func"](data=data, **kwds)
-            return response
-        except Exception as e:
-            self.logger.error(f"Error while handling request for path: {path}\n{str(e)}")
-            raise HTTPException(status_code=500, detail="Internal server error" + (": "+str(e) if self.show_errors else ""))
-
-    def resolve_annotations(self, annot_dict: dict[str, Any], obj_dict: dict[type, Any]) -> dict[str, Any]:
-        result = {}
-        for name, annot_type in annot_dict.items():
-            if annot_type in obj_dict and obj_dict[annot_type] is not None:
-                result[name] = obj_dict[annot_type]
-            else:
-                result[name] = None
-        return result
-
-    def validate(self, model: Type[BaseModel], json: dict | list):
-        try:
-            return model.model_validate(json)
-        except Exception as e:
-            return HTTPException(status_code=422, detail="Field validation error: "+str(e))
-
-    def new_handler(self: Self, method: str, func: Callable, /, model: Optional[Type[BaseModel]], sig: dict):
-        self.handlers[method] = {
-            "model": model, "sig": sig, "func": func
-        }
-    
     def handler(self: Self, method: str):
         def wrapper(func):
             sig = inspect.signature(func)
@@ -471,87 +533,49 @@ class Child:
             return func
         return wrapper
 
-    def model(self, **fields):
-        annotations = {}
-        defaults = {}
-        for key, value in fields.items():
-            if isinstance(value, tuple) and len(value) == 2:
-                annotations[key] = value[0]
-                defaults[key] = value[1]
-            else:
-                annotations[key] = value
-        return type(
-            "DynamicModel",
-            (BaseModel,),
-            {**defaults, "__annotations__": annotations, **self.request_base}
-        )
-    
-    def on_connect(self: Self, func: Callable):
-        self._on_connect_handler = func
-        return func
-
-    async def _init_base(self: Self):
-        pingmodel = self.model()
-        @self.handler("ping")
-        async def ping_handler(data: pingmodel):
-            try:
-                return {"status": "ok"}
-            except Exception as e:
-                raise HTTPException(status_code=500, detail="Internal server error" + (": "+str(e) if self.show_errors else ""))
-            
-        @self.handler("info")
-        async def info_handler(data):
-            try:
-                return {
-                    "handlers": list(self.handlers.keys()),
-                    "allowed_methods": self.allowed_methods,
-                    "ws_path": self.ws_endpoint
-                }
-            except Exception as e:
-                raise HTTPException(status_code=500, detail="Internal server error" + (": "+str(e) if self.show_errors else ""))
-
-    def include_router(self, router: 'Router'):
-        self.handlers.update({
-            f"{router.name}/{k}": v for k, v in router.handlers.items()
-        })
-
-    def __init__(self: Self, *, 
-                request_base: Optional[dict] = {},
+class Child(_DispatchBase):
+    def __init__(self: Self, *,
+                request_base: Optional[dict] = None,
                 static_folder: Optional[str] = None,
                 init_base: bool = True,
                 host: str = "0.0.0.0",
                 port: int = 4000,
                 reload: bool = False,
+                loop: Literal["auto", "uvloop", "uring"] = "auto",
                 static_origin: str = "/static",
                 is_static_folder_html: bool = True,
                 show_errors: bool = False,
-                allow_origin: list = ["*"], 
-                allow_headers: list = ["*"], 
+                allow_origin: Optional[list] = None,
+                allow_headers: Optional[list] = None,
                 allowed_credentials: bool = True,
+                coalesce_ms: float = 0,
+                coalesce_max: int = 32,
                 ws_endpoint: str = "/ws"):
 
         self.show_errors = show_errors
-        self._api = FastAPI()
+        self._api = FastAPI(default_response_class=_response_class)
         self.init_base = init_base
         self._run_config = Config(
             app=self._api,
             host=host,
             port=port,
             reload=reload,
+            loop=_resolve_loop(loop),
+            http="httptools",
+            ws="websockets",
         )
         self.ws_endpoint = ws_endpoint
+        self.coalesce_ms = coalesce_ms
+        self.coalesce_max = coalesce_max
         self._parent: PythujsServer
 
-        try:
-            self._api.add_middleware(
-                CORSMiddleware,
-                allow_origins=allow_origin,
-                allow_credentials=allowed_credentials,
-                allow_methods=["GET", "POST"],
-                allow_headers=allow_headers,
-            )
-        except Exception as e:
-            raise StartingServerError("Error while adding CORS middleware!") from e
+        self._api.add_middleware(
+            CORSMiddleware,
+            allow_origins=allow_origin if allow_origin is not None else ["*"],
+            allow_credentials=allowed_credentials,
+            allow_methods=["GET", "POST"],
+            allow_headers=allow_headers if allow_headers is not None else ["*"],
+        )
 
         if static_folder:
             if not os.path.exists(static_folder):
@@ -561,30 +585,23 @@ class Child:
             self._api.mount(static_origin, StaticFiles(directory=static_folder, html=is_static_folder_html), name="static")
 
         self.logger = logging.getLogger("pythujs")
-        self.request_base = request_base
+        self.request_base = request_base if request_base is not None else {}
         self.handlers: dict = {}
-        self.ws_handlers: dict[str, Callable] = {}
-        self.active_sockets: dict[str, WebSocket] = {}
+        self.active_sockets: dict[WebSocket, asyncio.Queue] = {}
         self._api.websocket(ws_endpoint)(self._ws_dispatcher)
 
     async def run(self: Self):
         if self.init_base:
             await self._init_base()
-        self._api.api_route("/{path:path}", methods=["GET", "POST"])(self._distpatcher)
         self.server = Server(config=self._run_config)
         self.logger.info(f"Starting Child server on port {self._run_config.port}...")
         return await self.server.serve()
 
-    async def stop(self: Self):
-        self.server.shutdown()
-        os.kill(os.getpid(), signal.SIGINT)
-        self.logger.info(f"Pythujs server stopped.") 
-
 
 __all__ = ["PythujsServer", "Router", "WebSocket", "HTTPException", "Request", "BaseModel", "HandlerError", "StartingServerError", "Child", "FileResponse", "HTMLResponse"]
 __version__ = (0, 1, 0)
-__version_str__ = ".".join(map(str, __version__))
+__version_str__ = "0.1.0"
 __author__ = "M2.128 (Mark)"
-__requires__ = ["fastapi", "uvicorn", "pydantic"]
+__requires__ = ["fastapi", "uvicorn[standard]", "pydantic"]
 __license__ = "MIT"
-logging.getLogger("pythujs").setLevel(logging.INFO)
\ No newline at end of file
+logging.getLogger("pythujs").setLevel(logging.INFO)